@@ -0,0 +1,235 @@
+"""Static question catalogs for the GPAI classification tool.
+
+The module is imported once per process, so every session and rerun shares
+these objects. The mappings are read-only for that reason.
+"""
+from types import MappingProxyType
+
+# Answer options shared by every radio that uses the same scale, and the
+# points the detailed assessment awards for them.
+YES_NO = ("Yes", "No")
+YES_PARTLY_NO = ("Yes", "Partly", "No")
+YES_PARTIAL_NO = ("Yes", "Partial", "No")
+MODALITIES = ("Multi-modal", "Single-flexible", "Single-specialized")
+MCDA_SCALE = (1, 2, 3, 4, 5)
+TWO_POINT_SCALE = (2, 0)
+THREE_POINT_SCALE = (2, 1, 0)
+
+# Step 3: pre-screening questions as (question, guidance). Questions that
+# eliminate a model on their own come first.
+PRE_QUESTIONS = MappingProxyType({
+    "single_task": (
+        "Is the model effective only for a single, narrowly-defined task?",
+        "GPAI models must competently address multiple distinct tasks."
+    ),
+    "adaptability": (
+        "Is the model unable to adapt or be repurposed for different tasks?",
+        "Adaptability (e.g., fine-tuning) is crucial for GPAI classification."
+    ),
+    "params_below": (
+        "Is the model's parameter count significantly below 1 billion?",
+        "Models under 1 billion parameters generally lack significant generality."
+    ),
+    "trained_specialized": (
+        "Was the model trained primarily on specialized, limited datasets?",
+        "General-purpose AI typically relies on large, diverse training datasets."
+    )
+})
+
+# Step 3a: substantial modification (MCDA) subcriteria as (question, guidance),
+# each scored from 1 to 5.
+INTENDED_PURPOSE_SUBCRITERIA = MappingProxyType({
+    "intended_tasks": (
+        "Intended Tasks & Integration:\n"
+        "Does the modification change the description of intended tasks or affect the list of high-risk or restricted tasks (Annex XI 1.(a))?",
+        "- 1: No change.\n- 3: Minor change in task description.\n- 5: Introduces a completely new use case with different stakeholder/regulatory implications."
+    ),
+    "acceptable_use": (
+        "Acceptable Use Policy Consistency:\n"
+        "Does the modification affect acceptable use policy elements (Annex XI 1.(b))?",
+        "- 1: No change.\n- 3: Some adjustments in policy.\n- 5: Substantial policy revisions that alter permitted applications."
+    ),
+    "licensing": (
+        "Licensing & Asset Release:\n"
+        "Does the change alter the model’s licensing terms or the list of released assets (Annex XI 1.(f))?",
+        "- 1: No change.\n- 3: Minor modifications.\n- 5: Changes that could affect downstream usage or legal compliance."
+    )
+})
+
+ARCHITECTURAL_SUBCRITERIA = MappingProxyType({
+    "model_architecture": (
+        "Model Architecture and Parameter Changes:\n"
+        "Does the modification change the overall architecture or parameter settings (Annex XI 1.(d))?",
+        "- 1: Minor tweaks.\n- 3: Moderate modifications.\n- 5: Fundamental redesign."
+    ),
+    "design_training": (
+        "Design Specifications & Training Process:\n"
+        "Are there changes in design choices or training process steps (Annex XI 1 2.(b))?",
+        "- 1: Negligible impact.\n- 3: Moderate revisions.\n- 5: Major revisions that could change how the model learns."
+    ),
+    "io_modalities": (
+        "Input/Output Modalities:\n"
+        "Has the modality, format, or limits of inputs/outputs changed (Annex XI 1.(e))?",
+        "- 1: No change.\n- 3: Some changes affecting data handling.\n- 5: Significant alteration affecting inputs/outputs."
+    )
+})
+
+DATA_SUBCRITERIA = MappingProxyType({
+    "data_acquisition": (
+        "Data Acquisition & Composition:\n"
+        "Does the modification alter data sourcing (methods, time periods, source proportions) (Annex XI 1 2.(c))?",
+        "- 1: No change.\n- 3: Moderate change.\n- 5: Substantial changes that could introduce bias."
+    ),
+    "data_processing": (
+        "Data Processing & Quality:\n"
+        "Are there modifications in data processing techniques (handling copyrighted, personal, or harmful data) (Annex XI 1 2.(c), Draft Document 17)?",
+        "- 1: Minor adjustments.\n- 3: Moderate changes.\n- 5: Major processing changes with potential impacts on quality."
+    ),
+    "compute_resources": (
+        "Computational Resources:\n"
+        "Do training hardware, duration, or compute metrics change (Annex XI 1 2.(d))?",
+        "- 1: Minor resource tweaks.\n- 3: Moderate changes.\n- 5: Major shifts affecting training scale or efficiency."
+    ),
+    "energy_consumption": (
+        "Energy Consumption:\n"
+        "Does the modification significantly change energy usage or emissions (Annex XI 1 2.(e))?",
+        "- 1: Negligible impact.\n- 3: Moderate change.\n- 5: Significant impact on environmental cost."
+    )
+})
+
+PERFORMANCE_SUBCRITERIA = MappingProxyType({
+    "quant_performance": (
+        "Quantitative Performance Metrics:\n"
+        "Does the modification result in measurable changes in accuracy, error rates, or other key metrics (Annex Article 53(1)(a))?",
+        "- 1: No measurable impact.\n- 3: Moderate change (e.g., 5-10% shift).\n- 5: Significant performance shifts."
+    ),
+    "qual_risk": (
+        "Qualitative Risk Assessment:\n"
+        "Does the modification introduce new failure modes, vulnerabilities, or ethical concerns (Annex Article 53(1)(a))?",
+        "- 1: No new risks.\n- 3: Some new risks but manageable.\n- 5: High risk or new critical vulnerabilities."
+    ),
+    "testing_results": (
+        "Testing Process and Results:\n"
+        "Are there significant changes in test outcomes or evaluation reports?",
+        "- 1: Unchanged test results.\n- 3: Moderate changes observed.\n- 5: Substantial changes impacting reliability."
+    )
+})
+
+FUTURE_DEPLOYMENT_SUBCRITERIA = MappingProxyType({
+    "distribution_release": (
+        "Distribution & Release:\n"
+        "Are there changes in the model’s release date, distribution channels, or level of access (Annex XI 1.(c))?",
+        "- 1: Unchanged.\n- 3: Moderate changes.\n- 5: Significant changes affecting market timing or user access."
+    ),
+    "external_dependencies": (
+        "External Dependencies:\n"
+        "Does the modification change how the model interacts with external hardware/software (Annex XII 1.(d) and 1.(e))?",
+        "- 1: No change.\n- 3: Some modifications.\n- 5: Significant modifications requiring new dependencies."
+    ),
+    "integration_documentation": (
+        "Integration Documentation:\n"
+        "Are there revisions to the technical documentation guiding model integration (Annex XI 1 2.(a))?",
+        "- 1: Minor updates.\n- 3: Moderate changes.\n- 5: Substantial changes affecting downstream implementation."
+    )
+})
+
+# Step 3a: MCDA categories as (title, label, weight, widget key prefix,
+# subcriteria), in the order their weighted averages are summed. Keys double
+# as the audit names of the category averages.
+MCDA_CATEGORIES = MappingProxyType({
+    "intended_purpose": (
+        "Intended Purpose Change", "Intended Purpose", 0.30, "intended",
+        INTENDED_PURPOSE_SUBCRITERIA
+    ),
+    "architectural": (
+        "Architectural/Algorithmic Changes", "Architectural/Algorithmic", 0.25, "arch",
+        ARCHITECTURAL_SUBCRITERIA
+    ),
+    "data": (
+        "Data/Training Changes", "Data/Training", 0.20, "data",
+        DATA_SUBCRITERIA
+    ),
+    "performance": (
+        "Performance/Risk Impact", "Performance/Risk Impact", 0.15, "perf",
+        PERFORMANCE_SUBCRITERIA
+    ),
+    "future_deployment": (
+        "Future Deployment Change", "Future Deployment", 0.10, "future",
+        FUTURE_DEPLOYMENT_SUBCRITERIA
+    )
+})
+
+# Step 4: detailed assessment as (question, options, points, guidance).
+DETAILED_QUESTIONS = MappingProxyType({
+    "params": (
+        "Does the model have at least 1 billion parameters?",
+        YES_NO,
+        TWO_POINT_SCALE,
+        "Models ≥1B parameters indicate significant generality (Recital 98)."
+    ),
+    "training": (
+        "Was the model trained on large diverse datasets using self-supervision?",
+        YES_PARTLY_NO,
+        THREE_POINT_SCALE,
+        "Generality arises from extensive data and self-supervised learning."
+    ),
+    "tasks": (
+        "Does the model demonstrate competent performance in multiple distinct tasks?",
+        YES_PARTLY_NO,
+        THREE_POINT_SCALE,
+        "Competence in multiple tasks characterizes GPAI."
+    ),
+    "generative": (
+        "Can the model generate adaptable content across tasks/domains?",
+        YES_PARTLY_NO,
+        THREE_POINT_SCALE,
+        "Generative flexibility aligns with GPAI."
+    ),
+    "modality": (
+        "What data modality does the model handle?",
+        MODALITIES,
+        THREE_POINT_SCALE,
+        "Multi-modality or flexible single-modality aligns with GPAI criteria."
+    ),
+    "integration": (
+        "Can the model be readily integrated, fine-tuned, or prompt-engineered for new applications?",
+        YES_NO,
+        TWO_POINT_SCALE,
+        "High adaptability supports GPAI classification."
+    ),
+    "use_cases": (
+        "Are there multiple known or intended downstream use cases spanning different domains?",
+        YES_PARTIAL_NO,
+        THREE_POINT_SCALE,
+        "Broad downstream applicability supports GPAI."
+    )
+})
+
+# Step 5: systemic risk indicators as (short label, question).
+SYS_RISK_QUESTIONS = MappingProxyType({
+    "flops": (
+        "≥10^25 training FLOP",
+        "Does the model training involve ≥10^25 floating-point operations (FLOP)?"
+    ),
+    "state_of_art": (
+        "State of the art",
+        "Is the model state-of-the-art or pushing state-of-the-art?"
+    ),
+    "scalability": (
+        "Significant reach",
+        "Does the model have significant reach or scalability?"
+    ),
+    "scaffolding": (
+        "Harm via scaffolding",
+        "Can the model significantly enable harmful applications through scaffolding?"
+    )
+})
+
+# Streamlit widget keys per question. The app script reruns on every
+# interaction but this module does not, so the keys are formatted only once.
+PRE_WIDGET_KEYS = MappingProxyType({key: f"pre_{key}" for key in PRE_QUESTIONS})
+MCDA_WIDGET_KEYS = MappingProxyType({
+    name: MappingProxyType({key: f"{prefix}_{key}" for key in subcriteria})
+    for name, (_, _, _, prefix, subcriteria) in MCDA_CATEGORIES.items()
+})
+DETAILED_WIDGET_KEYS = MappingProxyType({key: f"detailed_{key}" for key in DETAILED_QUESTIONS})